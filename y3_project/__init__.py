@@ -0,0 +1,7 @@
+"""
+Dataset splitting and label assessment tools for the Y3 project.
+
+Every step is a side-effect-free function in y3_project.splitting or y3_project.assessing,
+so a long-running process can import them once and call them repeatedly. The same steps
+are available from the command line with `python -m y3_project <command>`.
+"""
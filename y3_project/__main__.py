@@ -0,0 +1,31 @@
+import sys
+import importlib
+
+# Command name -> module with a main(argv) function, in pipeline order.
+# Modules are imported only when their command runs.
+COMMANDS = {
+    "overview": "y3_project.splitting.for_overview_in_system_folder",
+    "classes": "y3_project.splitting.for_classes",
+    "sort-duplicates": "y3_project.splitting.for_sort_duplicates",
+    "sort-classes": "y3_project.splitting.for_folder_sort_classes",
+    "sort-use": "y3_project.splitting.for_folder_sort_use",
+    "filter-classes": "y3_project.splitting.for_filter_out_no_used_class",
+    "sort-big-folders": "y3_project.splitting.for_sorting_finial_big_3_folders",
+    "check-images": "y3_project.splitting.for_check_images",
+    "evaluate": "y3_project.assessing.assessing",
+    "statistics": "y3_project.assessing.statistics",
+}
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0] not in COMMANDS:
+        print("Usage: python -m y3_project <command> [options]")
+        print("\nCommands:")
+        for command in COMMANDS:
+            print(f"  {command}")
+        return 0 if argv and argv[0] in ("-h", "--help") else 1
+    module = importlib.import_module(COMMANDS[argv[0]])
+    return module.main(argv[1:])
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,18 @@
+import importlib
+
+# Public functions -> the module that defines them, imported on first access.
+_EXPORTS = {
+    "evaluate_detections": ".assessing",
+    "pair_annotations": ".assessing",
+    "plot_confusion_matrix": ".assessing",
+    "parse_annotations": ".statistics",
+}
+
+__all__ = sorted(_EXPORTS) + ["error_index"]
+
+def __getattr__(name):
+    if name == "error_index":
+        return importlib.import_module(".error_index", __name__)
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
@@ -0,0 +1,382 @@
+import os
+import re
+import sys
+import argparse
+import xml.etree.ElementTree as ET
+from collections import defaultdict
+from .error_index import TP, FP, FN, MISCLASS, write_error_index
+
+# numpy and matplotlib are imported inside the functions that use them, so pairing and
+# the error index can be used without paying for those imports.
+
+def parse_annotation(xml_file):
+    """
+    Parse a Pascal VOC XML annotation file.
+    Returns a list of objects, each a dict with:
+      - 'class': class label
+      - 'bbox': [xmin, ymin, xmax, ymax]
+      - 'score': detection confidence (defaults to 1.0 if not provided)
+    """
+    tree = ET.parse(xml_file)
+    root = tree.getroot()
+    objects = []
+    for obj in root.findall('object'):
+        cls = obj.find('name').text.strip()
+        bbox_node = obj.find('bndbox')
+        xmin = int(bbox_node.find('xmin').text)
+        ymin = int(bbox_node.find('ymin').text)
+        xmax = int(bbox_node.find('xmax').text)
+        ymax = int(bbox_node.find('ymax').text)
+        # Some prediction XML files might include a score; if missing, default to 1.0.
+        score_node = obj.find('score')
+        score = float(score_node.text) if score_node is not None else 1.0
+        objects.append({'class': cls, 'bbox': [xmin, ymin, xmax, ymax], 'score': score})
+    return objects
+
+def compute_iou(box1, box2):
+    """
+    Compute IoU for two boxes.
+    Boxes are expected in [xmin, ymin, xmax, ymax] format.
+    """
+    x1 = max(box1[0], box2[0])
+    y1 = max(box1[1], box2[1])
+    x2 = min(box1[2], box2[2])
+    y2 = min(box1[3], box2[3])
+    inter_area = max(0, x2 - x1 + 1) * max(0, y2 - y1 + 1)
+    box1_area = (box1[2] - box1[0] + 1) * (box1[3] - box1[1] + 1)
+    box2_area = (box2[2] - box2[0] + 1) * (box2[3] - box2[1] + 1)
+    union_area = box1_area + box2_area - inter_area
+    return inter_area / union_area if union_area > 0 else 0
+
+# Filename prefix used by the 'prefix' key strategy (RoboFlow names start with a numeric ID).
+NUMERIC_PREFIX = re.compile(r'^(\d+)')
+
+def _key_from_prefix(entry):
+    m = NUMERIC_PREFIX.match(entry.name)
+    return m.group(1) if m else None
+
+def _key_from_stem(entry):
+    return os.path.splitext(entry.name)[0]
+
+def _key_from_filename_tag(entry):
+    # The key is the image name without its extension, so a file with the tag
+    # (0001.jpg) and a file without it (0001.xml) end up with the same key.
+    # Stop at the <filename> tag instead of parsing the whole annotation.
+    try:
+        for _, elem in ET.iterparse(entry.path):
+            if elem.tag == 'filename':
+                if elem.text and elem.text.strip():
+                    return os.path.splitext(os.path.basename(elem.text.strip()))[0]
+                break
+            if elem.tag == 'object':
+                break
+    except ET.ParseError:
+        pass
+    # Fallback: use the XML file name without its extension.
+    return _key_from_stem(entry)
+
+# Available strategies for turning an XML file into an image key.
+KEY_STRATEGIES = {
+    'prefix': _key_from_prefix,
+    'filename': _key_from_filename_tag,
+    'stem': _key_from_stem,
+}
+
+def index_annotations(folder, key_strategy='prefix'):
+    """
+    Build an image key -> XML path index for one folder with a single os.scandir pass.
+    Returns a tuple of:
+      - index: dict of image key -> XML path
+      - collisions: dict of image key -> list of every XML path sharing that key
+      - unkeyed: list of XML paths the strategy could not produce a key for
+    On a collision the file with the smallest name is kept, so the result does not
+    depend on directory listing order.
+    """
+    if key_strategy not in KEY_STRATEGIES:
+        raise ValueError(f"Unknown key strategy '{key_strategy}', expected one of: {', '.join(KEY_STRATEGIES)}")
+    get_key = KEY_STRATEGIES[key_strategy]
+
+    index = {}
+    collisions = defaultdict(list)
+    unkeyed = []
+    with os.scandir(folder) as entries:
+        for entry in entries:
+            if not entry.name.lower().endswith('.xml') or not entry.is_file():
+                continue
+            key = get_key(entry)
+            if key is None:
+                unkeyed.append(entry.path)
+                continue
+            existing = index.get(key)
+            if existing is None:
+                index[key] = entry.path
+                continue
+            if not collisions[key]:
+                collisions[key].append(existing)
+            collisions[key].append(entry.path)
+            if entry.name < os.path.basename(existing):
+                index[key] = entry.path
+
+    for paths in collisions.values():
+        paths.sort()
+    return index, dict(collisions), sorted(unkeyed)
+
+def pair_annotations(gt_folder, pred_folder, key_strategy='prefix'):
+    """
+    Pair ground truth and predicted XML files by image key.
+    Returns a dict with:
+      - 'gt': image key -> ground truth XML path
+      - 'pred': image key -> predicted XML path
+      - 'pairs': sorted list of (image key, gt path, pred path) present on both sides
+      - 'gt_orphans' / 'pred_orphans': sorted lists of paths without a partner
+      - 'gt_collisions' / 'pred_collisions': image key -> paths sharing that key
+      - 'gt_unkeyed' / 'pred_unkeyed': paths the key strategy could not handle
+    """
+    gt_index, gt_collisions, gt_unkeyed = index_annotations(gt_folder, key_strategy)
+    pred_index, pred_collisions, pred_unkeyed = index_annotations(pred_folder, key_strategy)
+
+    pairs = [(img_id, gt_index[img_id], pred_index[img_id])
+             for img_id in sorted(gt_index.keys() & pred_index.keys())]
+    gt_orphans = sorted(path for img_id, path in gt_index.items() if img_id not in pred_index)
+    pred_orphans = sorted(path for img_id, path in pred_index.items() if img_id not in gt_index)
+
+    return {
+        'gt': gt_index,
+        'pred': pred_index,
+        'pairs': pairs,
+        'gt_orphans': gt_orphans,
+        'pred_orphans': pred_orphans,
+        'gt_collisions': gt_collisions,
+        'pred_collisions': pred_collisions,
+        'gt_unkeyed': gt_unkeyed,
+        'pred_unkeyed': pred_unkeyed,
+    }
+
+def report_pairing(pairing):
+    """
+    Print collisions, orphans and unkeyed files found by pair_annotations.
+    """
+    for side in ('gt', 'pred'):
+        for img_id, paths in sorted(pairing[f'{side}_collisions'].items()):
+            kept = os.path.basename(pairing[side][img_id])
+            names = ', '.join(os.path.basename(path) for path in paths)
+            print(f"Warning: {side} files share image id '{img_id}': {names} (keeping {kept})")
+        for path in pairing[f'{side}_unkeyed']:
+            print(f"Warning: no image id for {side} file {os.path.basename(path)}, skipping.")
+        orphans = pairing[f'{side}_orphans']
+        if orphans:
+            other = 'pred' if side == 'gt' else 'gt'
+            print(f"Warning: {len(orphans)} {side} file(s) have no {other} partner:")
+            for path in orphans:
+                print(f"  {os.path.basename(path)}")
+
+def evaluate_detections(iou_threshold, gt_folder, pred_folder, key_strategy='prefix', index_path=None):
+    """
+    Loop through ground truth and predicted XML files and calculate:
+      - Per-class precision, recall, and AP.
+      - Confusion matrix counts.
+    Files are matched by image key (see KEY_STRATEGIES); by default the numeric ID at the
+    beginning of the filename. Collisions and orphans are reported before evaluation;
+    orphans still count as missed or false detections.
+    If index_path is given, every box outcome (TP/FP/FN/MISCLASS with IoU and score) is also
+    written to an SQLite error index there; query it with the functions in error_index.py.
+    """
+    pairing = pair_annotations(gt_folder, pred_folder, key_strategy)
+    report_pairing(pairing)
+    gt_dict = pairing['gt']
+    pred_dict = pairing['pred']
+
+    # For AP calculation:
+    # For each class, stores a list of tuples (score, is_true_positive)
+    class_detections = defaultdict(list)
+    # Count total number of ground truth objects per class.
+    gt_counter_per_class = defaultdict(int)
+
+    # For confusion matrix: counts for ground truth vs. predicted classes.
+    # Count mismatches and the case where either is missing with a 'background' label.
+    confusion_counts = defaultdict(lambda: defaultdict(int))
+    all_classes = set()
+
+    # For the error index: one record per box, see error_index.write_error_index.
+    box_records = []
+
+    # Process each image based on the union of ground truth and prediction file IDs.
+    all_image_ids = set(gt_dict.keys()).union(pred_dict.keys())
+    for img_id in all_image_ids:
+        gt_file = gt_dict.get(img_id, None)
+        pred_file = pred_dict.get(img_id, None)
+        gt_objects = parse_annotation(gt_file) if gt_file is not None else []
+        pred_objects = parse_annotation(pred_file) if pred_file is not None else []
+
+        # Update class list and ground truth counts.
+        for obj in gt_objects:
+            all_classes.add(obj['class'])
+            gt_counter_per_class[obj['class']] += 1
+        for obj in pred_objects:
+            all_classes.add(obj['class'])
+
+        # Keep track of which ground truth boxes have already been matched.
+        gt_matched = [False] * len(gt_objects)
+
+        # Sort predictions by score (highest first) for AP computation.
+        pred_objects = sorted(pred_objects, key=lambda x: x['score'], reverse=True)
+
+        # For each predicted object, try to match with a ground truth box.
+        for pred in pred_objects:
+            best_iou = 0
+            best_match_idx = -1
+            for i, gt in enumerate(gt_objects):
+                if not gt_matched[i]:
+                    iou = compute_iou(pred['bbox'], gt['bbox'])
+                    if iou > best_iou:
+                        best_iou = iou
+                        best_match_idx = i
+            # If a match is found and IoU exceeds the threshold:
+            if best_iou >= iou_threshold and best_match_idx != -1:
+                gt_match = gt_objects[best_match_idx]
+                gt_matched[best_match_idx] = True
+                if pred['class'] == gt_match['class']:
+                    # Correct detection.
+                    class_detections[pred['class']].append((pred['score'], 1))
+                    confusion_counts[gt_match['class']][pred['class']] += 1
+                    outcome = TP
+                else:
+                    # Misclassification: count as FP for predicted class.
+                    class_detections[pred['class']].append((pred['score'], 0))
+                    confusion_counts[gt_match['class']][pred['class']] += 1
+                    outcome = MISCLASS
+                box_records.append((img_id, outcome, gt_match['class'], pred['class'],
+                                    best_iou, pred['score'], gt_match['bbox'], pred['bbox']))
+            else:
+                # No matching ground truth -> false positive.
+                class_detections[pred['class']].append((pred['score'], 0))
+                confusion_counts['background'][pred['class']] += 1
+                box_records.append((img_id, FP, None, pred['class'],
+                                    best_iou, pred['score'], None, pred['bbox']))
+
+        # For any ground truth objects not matched, count as false negatives.
+        for i, gt in enumerate(gt_objects):
+            if not gt_matched[i]:
+                confusion_counts[gt['class']]['background'] += 1
+                box_records.append((img_id, FN, gt['class'], None, None, None, gt['bbox'], None))
+
+    if index_path is not None:
+        image_files = {img_id: (gt_dict.get(img_id), pred_dict.get(img_id)) for img_id in all_image_ids}
+        write_error_index(index_path, box_records, image_files)
+
+    # Calculate per-class precision, recall, and AP.
+    import numpy as np
+    results = {}
+    for cls in all_classes:
+        detections = class_detections[cls]
+        if len(detections) == 0:
+            results[cls] = {'precision': 0, 'recall': 0, 'AP': 0}
+            continue
+        # Sort detections by score (descending).
+        detections = sorted(detections, key=lambda x: x[0], reverse=True)
+        tp = np.array([det[1] for det in detections])
+        fp = 1 - tp
+        cum_tp = np.cumsum(tp)
+        cum_fp = np.cumsum(fp)
+        total_gt = gt_counter_per_class[cls]
+        recall_curve = cum_tp / total_gt if total_gt > 0 else np.zeros_like(cum_tp)
+        precision_curve = cum_tp / (cum_tp + cum_fp + 1e-6)
+        # Calculate AP using numerical integration (trapezoidal rule).
+        AP = np.trapz(precision_curve, recall_curve)
+        results[cls] = {
+            'precision': precision_curve[-1],
+            'recall': recall_curve[-1],
+            'AP': AP
+        }
+    mAP = np.mean([results[cls]['AP'] for cls in results])
+    results['mAP'] = mAP
+
+    return results, confusion_counts, all_classes
+
+def plot_confusion_matrix(confusion_counts, classes):
+    """
+    Plot a confusion matrix using matplotlib.
+    The matrix compares ground truth labels (rows) to predicted labels (columns).
+    """
+    import numpy as np
+    import matplotlib.pyplot as plt
+
+    classes = sorted(list(classes))
+    # Include a 'background' category if it exists.
+    if 'background' in confusion_counts or any('background' in dic for dic in confusion_counts.values()):
+        if 'background' not in classes:
+            classes.append('background')
+    matrix = np.zeros((len(classes), len(classes)), dtype=int)
+    class_to_idx = {cls: idx for idx, cls in enumerate(classes)}
+    for gt_cls, preds in confusion_counts.items():
+        for pred_cls, count in preds.items():
+            if gt_cls not in class_to_idx:
+                class_to_idx[gt_cls] = len(class_to_idx)
+                classes.append(gt_cls)
+            if pred_cls not in class_to_idx:
+                class_to_idx[pred_cls] = len(class_to_idx)
+                classes.append(pred_cls)
+            i = class_to_idx[gt_cls]
+            j = class_to_idx[pred_cls]
+            matrix[i, j] = count
+
+    plt.figure(figsize=(10, 8))
+    plt.imshow(matrix, interpolation='nearest', cmap=plt.cm.Blues)
+    plt.title("Confusion Matrix")
+    plt.colorbar()
+    tick_marks = np.arange(len(classes))
+    plt.xticks(tick_marks, classes, rotation=45)
+    plt.yticks(tick_marks, classes)
+    thresh = matrix.max() / 2.0
+    for i in range(matrix.shape[0]):
+        for j in range(matrix.shape[1]):
+            plt.text(j, i, format(matrix[i, j], 'd'),
+                     horizontalalignment="center",
+                     color="white" if matrix[i, j] > thresh else "black")
+    plt.ylabel('Ground Truth')
+    plt.xlabel('Predicted')
+    plt.tight_layout()
+    plt.show()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Evaluate predicted Pascal VOC labels against trusted labels.")
+    parser.add_argument("gt_folder", help="Trusted label sub-folder (e.g. ./trusted labels/train).")
+    parser.add_argument("pred_folder", help="Predicted label sub-folder for the same split (e.g. ./pseudo labels/train).")
+    parser.add_argument("--iou-threshold", type=float, default=0.5, help="Model evaluation maximum overlap threshold.")
+    parser.add_argument("--key-strategy", choices=sorted(KEY_STRATEGIES), default='prefix',
+                        help="How files are paired: 'prefix' (numeric ID at start of filename), "
+                             "'filename' (<filename> tag) or 'stem' (full file name).")
+    parser.add_argument("--index", dest="index_path", default=None,
+                        help="Where to save per-image and per-box match outcomes (SQLite).")
+    parser.add_argument("--no-plot", action="store_true", help="Do not plot the confusion matrix.")
+    args = parser.parse_args(argv)
+
+    # Ensure the folders exist
+    for folder in (args.gt_folder, args.pred_folder):
+        if not os.path.exists(folder):
+            print(f"Error: The folder '{folder}' does not exist!")
+            return 1
+
+    # Run evaluation.
+    results, confusion_counts, classes = evaluate_detections(args.iou_threshold, args.gt_folder, args.pred_folder,
+                                                             args.key_strategy, args.index_path)
+
+    # Print evaluation results.
+    print("Evaluation Results:")
+    for cls, metrics in results.items():
+        if cls != "mAP":
+            print(f"Class {cls}: Precision: {metrics['precision']:.3f}, Recall: {metrics['recall']:.3f}, AP: {metrics['AP']:.3f}")
+    print(f"mAP: {results['mAP']:.3f}")
+    if args.index_path is not None:
+        print(f"Per-image error index saved to '{args.index_path}' (see error_index.worst_images).")
+
+    # Plot the confusion matrix (matplotlib is an optional dependency).
+    if not args.no_plot:
+        try:
+            plot_confusion_matrix(confusion_counts, classes)
+        except ImportError as e:
+            print(f"Cannot plot the confusion matrix ({e}). Install it with: pip install 'y3-project[plot]', or pass --no-plot.")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
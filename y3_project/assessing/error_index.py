@@ -0,0 +1,144 @@
+import os
+import sqlite3
+from pathlib import Path
+
+# Match outcomes recorded per box.
+TP = 'TP'                # prediction matched a ground truth box of the same class
+FP = 'FP'                # prediction with no ground truth box above the IoU threshold
+FN = 'FN'                # ground truth box no prediction was matched to
+MISCLASS = 'MISCLASS'    # prediction matched a ground truth box of a different class
+
+SCHEMA = """
+CREATE TABLE boxes (
+    image_id TEXT NOT NULL,
+    outcome TEXT NOT NULL,
+    gt_class TEXT,
+    pred_class TEXT,
+    iou REAL,
+    score REAL,
+    gt_bbox TEXT,
+    pred_bbox TEXT
+);
+CREATE TABLE images (
+    image_id TEXT PRIMARY KEY,
+    gt_file TEXT,
+    pred_file TEXT,
+    tp INTEGER NOT NULL,
+    fp INTEGER NOT NULL,
+    fn INTEGER NOT NULL,
+    misclass INTEGER NOT NULL,
+    errors INTEGER NOT NULL
+);
+CREATE TABLE image_classes (
+    image_id TEXT NOT NULL,
+    class TEXT NOT NULL,
+    tp INTEGER NOT NULL,
+    fp INTEGER NOT NULL,
+    fn INTEGER NOT NULL,
+    misclass INTEGER NOT NULL,
+    errors INTEGER NOT NULL
+);
+"""
+
+# Summary tables are built once at write time so queries never have to aggregate boxes.
+# Every evaluated image already has an images row (with zero counts); this fills in the counts.
+SUMMARY = f"""
+CREATE INDEX boxes_image ON boxes (image_id);
+UPDATE images SET (tp, fp, fn, misclass, errors) = (
+    SELECT SUM(outcome = '{TP}'), SUM(outcome = '{FP}'), SUM(outcome = '{FN}'), SUM(outcome = '{MISCLASS}'),
+           SUM(outcome != '{TP}')
+    FROM boxes WHERE boxes.image_id = images.image_id
+)
+WHERE image_id IN (SELECT image_id FROM boxes);
+INSERT INTO image_classes
+SELECT image_id, class,
+       SUM(outcome = '{TP}'), SUM(outcome = '{FP}'), SUM(outcome = '{FN}'), SUM(outcome = '{MISCLASS}'),
+       SUM(outcome != '{TP}')
+FROM (
+    SELECT image_id, gt_class AS class, outcome FROM boxes WHERE gt_class IS NOT NULL
+    UNION ALL
+    SELECT image_id, pred_class AS class, outcome FROM boxes
+    WHERE pred_class IS NOT NULL AND (gt_class IS NULL OR pred_class != gt_class)
+)
+GROUP BY image_id, class;
+CREATE INDEX boxes_pred ON boxes (outcome, pred_class, score DESC);
+CREATE INDEX boxes_gt ON boxes (outcome, gt_class);
+CREATE INDEX images_errors ON images (errors DESC);
+CREATE INDEX image_classes_errors ON image_classes (class, errors DESC);
+"""
+
+def write_error_index(index_path, box_records, image_files):
+    """
+    Write per-box match outcomes to an SQLite file, replacing any existing index.
+
+    Args:
+        index_path (str): Path of the SQLite file to create.
+        box_records (list): (image_id, outcome, gt_class, pred_class, iou, score, gt_bbox, pred_bbox) tuples;
+            classes, iou, score and boxes are None where they do not apply.
+        image_files (dict): Image id -> (gt_file, pred_file) for every evaluated image.
+    """
+    if os.path.exists(index_path):
+        os.remove(index_path)
+    conn = sqlite3.connect(index_path)
+    try:
+        conn.executescript(SCHEMA)
+        conn.executemany(
+            "INSERT INTO images VALUES (?, ?, ?, 0, 0, 0, 0, 0)",
+            [(img_id, gt_file, pred_file) for img_id, (gt_file, pred_file) in image_files.items()])
+        conn.executemany(
+            "INSERT INTO boxes VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            [(img_id, outcome, gt_cls, pred_cls, iou, score,
+              ','.join(map(str, gt_bbox)) if gt_bbox is not None else None,
+              ','.join(map(str, pred_bbox)) if pred_bbox is not None else None)
+             for img_id, outcome, gt_cls, pred_cls, iou, score, gt_bbox, pred_bbox in box_records])
+        conn.executescript(SUMMARY)
+        conn.commit()
+    finally:
+        conn.close()
+
+def _query(index_path, sql, params):
+    conn = sqlite3.connect(Path(index_path).resolve().as_uri() + "?mode=ro", uri=True)
+    conn.row_factory = sqlite3.Row
+    try:
+        return [dict(row) for row in conn.execute(sql, params)]
+    finally:
+        conn.close()
+
+def worst_images(index_path, cls=None, limit=100):
+    """
+    Return the images with the most errors (FP + FN + MISCLASS), worst first.
+    If cls is given, only boxes where that class is the ground truth or predicted class count.
+    Each result is a dict with image_id, gt_file, pred_file, tp, fp, fn, misclass and errors;
+    the counts are for cls only when it is given.
+    """
+    if cls is None:
+        sql = ("SELECT image_id, gt_file, pred_file, tp, fp, fn, misclass, errors FROM images "
+               "WHERE errors > 0 ORDER BY errors DESC, image_id LIMIT ?")
+        return _query(index_path, sql, (limit,))
+    sql = ("SELECT c.image_id, i.gt_file, i.pred_file, c.tp, c.fp, c.fn, c.misclass, c.errors "
+           "FROM image_classes AS c JOIN images AS i ON i.image_id = c.image_id "
+           "WHERE c.class = ? AND c.errors > 0 ORDER BY c.errors DESC, c.image_id LIMIT ?")
+    return _query(index_path, sql, (cls, limit))
+
+def image_boxes(index_path, image_id):
+    """
+    Return every recorded box outcome for one image.
+    """
+    sql = ("SELECT outcome, gt_class, pred_class, iou, score, gt_bbox, pred_bbox FROM boxes "
+           "WHERE image_id = ? ORDER BY outcome, score DESC")
+    return _query(index_path, sql, (image_id,))
+
+def boxes_by_outcome(index_path, outcome, cls=None, limit=100):
+    """
+    Return boxes with the given outcome (e.g. FP), optionally for one class, highest score first.
+    For FN boxes cls matches the ground truth class, otherwise the predicted class.
+    """
+    sql = ("SELECT image_id, outcome, gt_class, pred_class, iou, score, gt_bbox, pred_bbox FROM boxes "
+           "WHERE outcome = ?")
+    params = [outcome]
+    if cls is not None:
+        sql += " AND gt_class = ?" if outcome == FN else " AND pred_class = ?"
+        params.append(cls)
+    sql += " ORDER BY score DESC LIMIT ?"
+    params.append(limit)
+    return _query(index_path, sql, params)
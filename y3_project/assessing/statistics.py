@@ -1,4 +1,6 @@
 import os
+import sys
+import argparse
 import xml.etree.ElementTree as ET
 from collections import Counter, defaultdict
 
@@ -51,12 +53,18 @@ def parse_annotations(annotation_dir):
     
     return total_objects, images_per_class
 
-if __name__ == '__main__':
-    # Path to the folder containing annotated labels by Grounding DINO via Pascal VOC XML files format. (e.g. C:\Users\username\Download\Y3 Proj\predicted labels\train)
-    xml_sub_folder = r"REPLACE_WITH_PATH_TO_COMBINED_XML_SUB_FOLDER"
-    
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Count objects and images per class in a folder of Pascal VOC XML files.")
+    parser.add_argument("xml_sub_folder", help="Folder of annotated labels (e.g. ./predicted labels/train).")
+    args = parser.parse_args(argv)
+
+    # Ensure the folder exists
+    if not os.path.exists(args.xml_sub_folder):
+        print(f"Error: The folder '{args.xml_sub_folder}' does not exist!")
+        return 1
+
     # Compute statistics
-    objects_stats, images_stats = parse_annotations(xml_sub_folder)
+    objects_stats, images_stats = parse_annotations(args.xml_sub_folder)
     
     # Print overall statistics
     print("Object Counts per Class:")
@@ -66,3 +74,7 @@ if __name__ == '__main__':
     print("\nImage Counts per Class (number of images in which each class appears):")
     for cls, count in images_stats.items():
         print(f" - {cls}: {count} image(s)")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,25 @@
+import importlib
+
+# Public step functions -> the module that defines them. Modules are imported on first
+# access, so running one command does not load every other step.
+_EXPORTS = {
+    "overview": ".for_overview_in_system_folder",
+    "write_class_files": ".for_classes",
+    "sort_duplicates": ".for_sort_duplicates",
+    "sort_into_class_folders": ".for_folder_sort_classes",
+    "sort_into_class_folders_async": ".for_folder_sort_classes",
+    "available_classes": ".for_folder_sort_use",
+    "combine_classes": ".for_folder_sort_use",
+    "combine_classes_async": ".for_folder_sort_use",
+    "filter_out_classes": ".for_filter_out_no_used_class",
+    "move_into_big_folders": ".for_sorting_finial_big_3_folders",
+    "move_into_big_folders_async": ".for_sorting_finial_big_3_folders",
+    "scan_folder": ".for_check_images",
+}
+
+__all__ = sorted(_EXPORTS)
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
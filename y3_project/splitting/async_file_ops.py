@@ -0,0 +1,98 @@
+import os
+import time
+import asyncio
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+
+# How many copy/move calls may be in flight at once (network shares benefit from more).
+DEFAULT_CONCURRENCY = 32
+
+# How often (in seconds) progress is printed while operations run.
+PROGRESS_INTERVAL = 1.0
+
+def list_folder(folder):
+    """
+    List a folder once with os.scandir.
+    Returns a tuple of (set of file names, set of sub-folder names); both are empty if the folder does not exist.
+    """
+    files = set()
+    subdirs = set()
+    if not os.path.isdir(folder):
+        return files, subdirs
+    with os.scandir(folder) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                subdirs.add(entry.name)
+            else:
+                files.add(entry.name)
+    return files, subdirs
+
+def positive_int(value):
+    """
+    argparse type for --concurrency: an integer of at least 1.
+    """
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+async def run_file_ops_async(ops, concurrency=DEFAULT_CONCURRENCY, label="Processed"):
+    """
+    Awaitable version of run_file_ops, for callers that already run an event loop.
+    Takes the same arguments and returns the same (succeeded, failed) tuple.
+    """
+    if concurrency < 1:
+        raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+    if not ops:
+        print(f"{label}: nothing to do.")
+        return 0, 0
+
+    total = len(ops)
+    done = 0
+    failed = 0
+    start = time.perf_counter()
+    last_report = start
+    loop = asyncio.get_running_loop()
+    pending = iter(ops)
+
+    async def worker(pool):
+        nonlocal done, failed, last_report
+        # Workers share one iterator, so only `concurrency` operations exist at any time.
+        for func, src, dst in pending:
+            try:
+                await loop.run_in_executor(pool, func, src, dst)
+            except OSError as e:
+                failed += 1
+                print(f"Error processing {src}: {e}")
+            done += 1
+            now = time.perf_counter()
+            if now - last_report >= PROGRESS_INTERVAL and done < total:
+                last_report = now
+                print(f"{label}: {done}/{total} file(s) ({done / (now - start):.1f} files/s)")
+
+    # A pool of its own: the loop's default executor is capped at min(32, cpu_count + 4) threads.
+    workers = min(concurrency, total)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        await asyncio.gather(*(worker(pool) for _ in range(workers)))
+
+    elapsed = time.perf_counter() - start
+    rate = total / elapsed if elapsed > 0 else 0.0
+    print(f"{label}: {total - failed}/{total} file(s) in {elapsed:.2f}s ({rate:.1f} files/s)")
+    return total - failed, failed
+
+def run_file_ops(ops, concurrency=DEFAULT_CONCURRENCY, label="Processed"):
+    """
+    Run file operations (e.g. shutil.move, shutil.copy2) concurrently in worker threads.
+
+    Args:
+        ops (list): (func, src, dst) tuples; each runs as func(src, dst).
+        concurrency (int): Maximum number of operations in flight at once (at least 1).
+        label (str): Prefix for progress and throughput lines.
+
+    Returns:
+        succeeded (int): Number of operations that completed.
+        failed (int): Number of operations that raised an OSError.
+
+    Uses asyncio.run, so it cannot be called from a running event loop; await run_file_ops_async there instead.
+    """
+    return asyncio.run(run_file_ops_async(ops, concurrency, label))
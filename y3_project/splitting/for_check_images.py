@@ -0,0 +1,212 @@
+import os
+import sys
+import mmap
+import argparse
+import struct
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+
+# SOF markers that carry the frame size (C4 = DHT, C8 = JPG extension, CC = DAC are not frames).
+SOF_MARKERS = {0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF}
+# Markers without a length field.
+STANDALONE_MARKERS = {0x01, 0xD0, 0xD1, 0xD2, 0xD3, 0xD4, 0xD5, 0xD6, 0xD7}
+# Bytes some encoders and tools append after the EOI marker.
+PADDING_BYTES = (0x00, 0xFF)
+
+def read_jpeg_header(jpg_path):
+    """
+    Read the width and height of a JPEG from its SOF segment without decoding any pixels.
+    The file is memory-mapped, so only the header pages and the last page are read from disk.
+    Returns (width, height, error); width/height are None if the header is unusable and
+    error is None if the file looks complete.
+    """
+    with open(jpg_path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size < 4:
+            return None, None, "empty or truncated file"
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if mm[0:2] != b"\xff\xd8":
+                return None, None, "not a JPEG (missing SOI marker)"
+
+            width = height = None
+            pos = 2
+            while pos < size:
+                if mm[pos] != 0xFF:
+                    return None, None, f"corrupt marker at byte {pos}"
+                # Skip fill bytes between markers.
+                while pos < size and mm[pos] == 0xFF:
+                    pos += 1
+                if pos >= size:
+                    break
+                marker = mm[pos]
+                pos += 1
+                if marker in STANDALONE_MARKERS:
+                    continue
+                if marker in (0xD9, 0xDA):
+                    # EOI or start of scan before any frame header.
+                    break
+                if pos + 2 > size:
+                    break
+                (length,) = struct.unpack(">H", mm[pos:pos + 2])
+                if length < 2 or pos + length > size:
+                    return None, None, f"truncated segment at byte {pos}"
+                if marker in SOF_MARKERS:
+                    if length < 7:
+                        return None, None, f"corrupt frame header at byte {pos}"
+                    height, width = struct.unpack(">HH", mm[pos + 3:pos + 7])
+                    break
+                pos += length
+
+            if width is None:
+                return None, None, "no frame header found (truncated or corrupt)"
+            if width == 0 or height == 0:
+                return width, height, "zero image dimension in frame header"
+            # EOI must be the last marker once any trailing padding is skipped.
+            end = size
+            while end > 0 and mm[end - 1] in PADDING_BYTES:
+                end -= 1
+            if end < 2 or mm[end - 2:end] != b"\xff\xd9":
+                return width, height, "truncated file (missing EOI marker)"
+            return width, height, None
+
+def read_voc_size_and_boxes(xml_path):
+    """
+    Read the <size> and the object boxes from a Pascal VOC XML file.
+    Returns (width, height, boxes) where width/height are None if <size> is missing
+    and boxes is a list of (class, xmin, ymin, xmax, ymax).
+    """
+    root = ET.parse(xml_path).getroot()
+    width = height = None
+    size_node = root.find("size")
+    if size_node is not None:
+        width_node = size_node.find("width")
+        height_node = size_node.find("height")
+        if width_node is not None and height_node is not None:
+            width = int(float(width_node.text))
+            height = int(float(height_node.text))
+
+    boxes = []
+    for obj in root.findall("object"):
+        name_tag = obj.find("name")
+        bbox_node = obj.find("bndbox")
+        if name_tag is None or bbox_node is None:
+            continue
+        boxes.append((name_tag.text.strip(),
+                      float(bbox_node.find("xmin").text),
+                      float(bbox_node.find("ymin").text),
+                      float(bbox_node.find("xmax").text),
+                      float(bbox_node.find("ymax").text)))
+    return width, height, boxes
+
+def check_pair(jpg_path, xml_path):
+    """
+    Check one image/annotation pair and return a list of problem descriptions (empty if fine).
+    Either path may be None if the partner file is missing.
+    """
+    problems = []
+    if jpg_path is None:
+        return [f"{os.path.basename(xml_path)}: image not found"]
+
+    try:
+        img_width, img_height, error = read_jpeg_header(jpg_path)
+    except (OSError, ValueError) as e:
+        return [f"{os.path.basename(jpg_path)}: cannot read ({e})"]
+    if error:
+        problems.append(f"{os.path.basename(jpg_path)}: {error}")
+
+    if xml_path is None:
+        problems.append(f"{os.path.basename(jpg_path)}: annotation not found")
+        return problems
+
+    try:
+        xml_width, xml_height, boxes = read_voc_size_and_boxes(xml_path)
+    except ET.ParseError as e:
+        problems.append(f"{os.path.basename(xml_path)}: parse error ({e})")
+        return problems
+    except (AttributeError, TypeError, ValueError) as e:
+        problems.append(f"{os.path.basename(xml_path)}: malformed annotation ({e})")
+        return problems
+
+    if img_width is not None and xml_width is not None and (img_width, img_height) != (xml_width, xml_height):
+        problems.append(f"{os.path.basename(xml_path)}: <size> {xml_width}x{xml_height} "
+                        f"does not match image {img_width}x{img_height}")
+
+    # Prefer the real image size for bounds, fall back to the XML <size>.
+    width = img_width if img_width is not None else xml_width
+    height = img_height if img_height is not None else xml_height
+    if width is None:
+        return problems
+    for cls, xmin, ymin, xmax, ymax in boxes:
+        if xmin < 0 or ymin < 0 or xmax > width or ymax > height:
+            problems.append(f"{os.path.basename(xml_path)}: {cls} box "
+                            f"[{xmin:g}, {ymin:g}, {xmax:g}, {ymax:g}] outside image {width}x{height}")
+    return problems
+
+def find_pairs(folder, recursive=False):
+    """
+    Pair every .jpg in the folder with its .xml by file stem.
+    Sub-folders are only included if recursive is set; after sort-use the same images are in
+    both the <class>_Train/_Validate/_Test folders and Train/Validate/Test, so scan one set of them.
+    Returns a list of (jpg_path, xml_path); either side is None if the partner is missing.
+    """
+    pairs = []
+    if recursive:
+        folders = os.walk(folder)
+    else:
+        folders = [(folder, None, [entry.name for entry in os.scandir(folder) if entry.is_file()])]
+    for root_dir, subdirs, files in folders:
+        images = {}
+        annotations = {}
+        for file in files:
+            stem, ext = os.path.splitext(file)
+            ext = ext.lower()
+            if ext in (".jpg", ".jpeg"):
+                images[stem] = os.path.join(root_dir, file)
+            elif ext == ".xml":
+                annotations[stem] = os.path.join(root_dir, file)
+        for stem in sorted(images.keys() | annotations.keys()):
+            pairs.append((images.get(stem), annotations.get(stem)))
+    return pairs
+
+def scan_folder(folder, max_workers=None, recursive=False):
+    """
+    Check every image/annotation pair in the folder (and its sub-folders if recursive) in a thread pool.
+    Returns a tuple of (number of pairs checked, list of problem descriptions).
+    """
+    pairs = find_pairs(folder, recursive)
+    if max_workers is None:
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+    problems = []
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        for pair_problems in pool.map(lambda pair: check_pair(*pair), pairs):
+            problems.extend(pair_problems)
+    return len(pairs), problems
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check every JPG header against its XML annotation without decoding pixels.")
+    parser.add_argument("xml_folder", help="Folder containing the XML and JPG files (e.g. ./Train).")
+    parser.add_argument("--recursive", action="store_true", help="Also check every sub-folder.")
+    parser.add_argument("--workers", type=int, default=None, help="Number of threads checking files.")
+    args = parser.parse_args(argv)
+
+    # Ensure the folder exists
+    if not os.path.exists(args.xml_folder):
+        print(f"Error: The folder '{args.xml_folder}' does not exist!")
+        return 1
+
+    # Output file listing every problem found
+    report_file = os.path.join(args.xml_folder, "image_check.txt")
+
+    checked, problems = scan_folder(args.xml_folder, args.workers, args.recursive)
+
+    with open(report_file, "w", encoding="utf-8") as out_f:
+        for problem in problems:
+            out_f.write(f"{problem}\n")
+
+    for problem in problems:
+        print(f"Warning: {problem}")
+    print(f"Checked {checked} image/annotation pair(s), found {len(problems)} problem(s). See '{report_file}'.")
+    return 1 if problems else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,63 @@
+import os
+import sys
+import argparse
+import xml.etree.ElementTree as ET
+
+# The class names to remove (exact match is used).
+DEFAULT_CLASSES_TO_REMOVE = ("Fire_Blanket", "Flashing_Light_Orbs")
+
+def filter_out_classes(xml_folder, classes_to_remove=DEFAULT_CLASSES_TO_REMOVE):
+    """
+    Remove every <object> of the given classes from all XML files under the folder (including sub-folders).
+    Returns the list of XML paths that were rewritten.
+    """
+    classes_to_remove = set(classes_to_remove)
+    updated = []
+
+    # Walk through all subfolders and files in the base directory.
+    for root_dir, subdirs, files in os.walk(xml_folder):
+        for file in files:
+            if file.lower().endswith(".xml"):
+                xml_path = os.path.join(root_dir, file)
+                try:
+                    tree = ET.parse(xml_path)
+                    root = tree.getroot()
+                    removed_objects = False
+
+                    # Find all object elements
+                    for obj in root.findall("object"):
+                        name_elem = obj.find("name")
+                        if name_elem is not None and name_elem.text in classes_to_remove:
+                            # Remove the <object> element from the root
+                            root.remove(obj)
+                            removed_objects = True
+
+                    # If any objects were removed, overwrite the file with the updated XML.
+                    if removed_objects:
+                        tree.write(xml_path)
+                        updated.append(xml_path)
+                        print(f"Updated: {xml_path}")
+                except ET.ParseError:
+                    print(f"Parse error in: {xml_path}")
+                except Exception as e:
+                    print(f"Error processing {xml_path}: {e}")
+
+    return updated
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Remove objects of unused classes from every XML file.")
+    parser.add_argument("xml_folder", help="Folder containing the XML files (sub-folders are included).")
+    parser.add_argument("--classes", default=",".join(DEFAULT_CLASSES_TO_REMOVE),
+                        help="Class names to remove (comma-separated).")
+    args = parser.parse_args(argv)
+
+    # Ensure the folder exists
+    if not os.path.exists(args.xml_folder):
+        print(f"Error: The folder '{args.xml_folder}' does not exist!")
+        return 1
+
+    filter_out_classes(args.xml_folder, [cls.strip() for cls in args.classes.split(",") if cls.strip()])
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
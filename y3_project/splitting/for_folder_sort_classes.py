@@ -0,0 +1,88 @@
+import os
+import sys
+import shutil
+import asyncio
+import argparse
+from .async_file_ops import DEFAULT_CONCURRENCY, list_folder, positive_int, run_file_ops, run_file_ops_async
+
+def _plan_class_folder_moves(xml_folder):
+    # Returns the (shutil.move, source, destination) operations for sort_into_class_folders.
+    # List the folder once; existence checks below use this set instead of a stat per file
+    folder_files, _ = list_folder(xml_folder)
+
+    # Get all class split text files (e.g., Fire_Extinguisher_Train.txt)
+    split_files = [f for f in folder_files if f.endswith("_Train.txt") or f.endswith("_Validate.txt") or f.endswith("_Test.txt")]
+
+    # Moves to run, as (function, source, destination)
+    move_ops = []
+
+    # Process each split file
+    for split_file in split_files:
+        # Extract the class name and split type (e.g., Fire_Extinguisher_Train)
+        split_name = os.path.splitext(split_file)[0]  # Remove .txt extension
+
+        # Create a new folder for this split
+        split_folder = os.path.join(xml_folder, split_name)
+        os.makedirs(split_folder, exist_ok=True)
+
+        # Read the XML filenames from the split file
+        split_file_path = os.path.join(xml_folder, split_file)
+        with open(split_file_path, "r", encoding="utf-8") as f:
+            xml_files = [line.strip() for line in f if line.strip()]
+
+        # Queue each XML file and its corresponding JPG file
+        for xml_file in xml_files:
+            jpg_file = xml_file.replace(".xml", ".jpg")
+
+            # Move XML file if it exists
+            if xml_file in folder_files:
+                folder_files.discard(xml_file)
+                move_ops.append((shutil.move, os.path.join(xml_folder, xml_file), os.path.join(split_folder, xml_file)))
+            else:
+                print(f"Warning: {xml_file} not found!")
+
+            # Move JPG file if it exists
+            if jpg_file in folder_files:
+                folder_files.discard(jpg_file)
+                move_ops.append((shutil.move, os.path.join(xml_folder, jpg_file), os.path.join(split_folder, jpg_file)))
+            else:
+                print(f"Warning: {os.path.join(xml_folder, jpg_file)} not found!")
+
+        print(f"Moving files to {split_folder}")
+
+    return move_ops
+
+def sort_into_class_folders(xml_folder, concurrency=DEFAULT_CONCURRENCY):
+    """
+    Move every XML file and its JPG listed in a <class>_Train/_Validate/_Test.txt split file
+    into a folder of the same name.
+    Returns a tuple of (number of files moved, number of moves that failed).
+    """
+    # Move everything with bounded concurrency
+    return run_file_ops(_plan_class_folder_moves(xml_folder), concurrency, label="Moved")
+
+async def sort_into_class_folders_async(xml_folder, concurrency=DEFAULT_CONCURRENCY):
+    """
+    Awaitable version of sort_into_class_folders, for callers that already run an event loop.
+    """
+    move_ops = await asyncio.to_thread(_plan_class_folder_moves, xml_folder)
+    return await run_file_ops_async(move_ops, concurrency, label="Moved")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Move the files of every class split into its own folder.")
+    parser.add_argument("xml_folder", help="Folder containing the XML/JPG files and the class split text files.")
+    parser.add_argument("--concurrency", type=positive_int, default=DEFAULT_CONCURRENCY, help="Maximum number of moves in flight at once.")
+    args = parser.parse_args(argv)
+
+    # Ensure the folder exists
+    if not os.path.exists(args.xml_folder):
+        print(f"Error: The folder '{args.xml_folder}' does not exist!")
+        return 1
+
+    sort_into_class_folders(args.xml_folder, args.concurrency)
+
+    print("Processing complete! All files moved to respective folders.")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,115 @@
+import os
+import sys
+import shutil
+import asyncio
+import argparse
+from .async_file_ops import DEFAULT_CONCURRENCY, list_folder, positive_int, run_file_ops, run_file_ops_async
+
+# Combined dataset folders, in the order they are filled
+SPLITS = ("Train", "Validate", "Test")
+
+def available_classes(xml_folder):
+    """
+    Return the sorted class names that have a <class>_Train/_Validate/_Test folder.
+    """
+    # Get available class names from folder names
+    _, subfolders = list_folder(xml_folder)
+    classes = set()
+    for folder in subfolders:
+        if folder.endswith("_Train") or folder.endswith("_Validate") or folder.endswith("_Test"):
+            class_name = folder.rsplit("_", 1)[0]  # Extract the class name (before _Train/_Validate/_Test)
+            classes.add(class_name)
+    return sorted(classes)
+
+def _plan_combine_copies(xml_folder, selected_classes):
+    # Returns the (shutil.copy2, source, destination) operations for combine_classes.
+    # Define the destination folders for Train, Validate, and Test
+    dest_folders = {split: os.path.join(xml_folder, split) for split in SPLITS}
+
+    # Create combined folders if they don't exist
+    for dest_folder in dest_folders.values():
+        os.makedirs(dest_folder, exist_ok=True)
+
+    # Files already in each combined folder, listed once and updated as copies are queued
+    dest_files = {folder: list_folder(folder)[0] for folder in dest_folders.values()}
+
+    # Copies to run, as (function, source, destination)
+    copy_ops = []
+
+    # Copy files into the correct combined dataset folders
+    for cls in selected_classes:
+        for split, dest_folder in dest_folders.items():
+            src_folder = os.path.join(xml_folder, f"{cls}_{split}")
+            if not os.path.exists(src_folder):
+                continue
+            existing = dest_files[dest_folder]
+            for file in sorted(list_folder(src_folder)[0]):
+                src_path = os.path.join(src_folder, file)
+                dest_path = os.path.join(dest_folder, file)
+
+                # Avoid overwriting if the file already exists
+                if file not in existing:
+                    existing.add(file)
+                    copy_ops.append((shutil.copy2, src_path, dest_path))
+                else:
+                    print(f"Skipping duplicate: {dest_path}")
+
+    return copy_ops
+
+def combine_classes(xml_folder, selected_classes, concurrency=DEFAULT_CONCURRENCY):
+    """
+    Copy the class split folders of the selected classes into the combined Train, Validate
+    and Test folders, skipping files that already exist there.
+    Returns a tuple of (number of files copied, number of copies that failed).
+    """
+    # Copy everything with bounded concurrency
+    return run_file_ops(_plan_combine_copies(xml_folder, selected_classes), concurrency, label="Copied")
+
+async def combine_classes_async(xml_folder, selected_classes, concurrency=DEFAULT_CONCURRENCY):
+    """
+    Awaitable version of combine_classes, for callers that already run an event loop.
+    """
+    copy_ops = await asyncio.to_thread(_plan_combine_copies, xml_folder, selected_classes)
+    return await run_file_ops_async(copy_ops, concurrency, label="Copied")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Combine the class split folders of the chosen classes into Train, Validate and Test.")
+    parser.add_argument("xml_folder", help="Folder containing the <class>_Train/_Validate/_Test folders.")
+    parser.add_argument("--classes", help="Class names to combine (comma-separated); asked for interactively if omitted.")
+    parser.add_argument("--concurrency", type=positive_int, default=DEFAULT_CONCURRENCY, help="Maximum number of copies in flight at once.")
+    args = parser.parse_args(argv)
+
+    # Ensure the folder exists
+    if not os.path.exists(args.xml_folder):
+        print(f"Error: The folder '{args.xml_folder}' does not exist!")
+        return 1
+
+    classes = available_classes(args.xml_folder)
+
+    # Ask what datasets to combine
+    requested = args.classes
+    if requested is None:
+        # Display available classes
+        print("\nAvailable Classes:")
+        for i, cls in enumerate(classes, 1):
+            print(f"{i}. {cls}")
+        requested = input("\nEnter the class names to combine (comma-separated, e.g., Fire_Extinguisher, Fire_Exit): ")
+
+    # Normalize the inputs (remove spaces and ensure valid classes)
+    selected_classes = [cls.strip() for cls in requested.strip().split(",") if cls.strip() in classes]
+
+    if not selected_classes:
+        print("No valid classes selected. Exiting.")
+        return 1
+
+    print(f"\nCombining datasets for: {', '.join(selected_classes)}")
+
+    combine_classes(args.xml_folder, selected_classes, args.concurrency)
+
+    print("\nDataset combination complete! Check the following folders:")
+    for split in SPLITS:
+        print(f"- {os.path.join(args.xml_folder, split)}")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
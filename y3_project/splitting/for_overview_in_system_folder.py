@@ -0,0 +1,80 @@
+import os
+import sys
+import argparse
+import xml.etree.ElementTree as ET
+
+# Number of sequentially named XML files (0000.xml to 1451.xml)
+DEFAULT_FILE_COUNT = 1452
+
+def overview(xml_folder, file_count=DEFAULT_FILE_COUNT):
+    """
+    Write output.txt (file names and object classes) and classes.txt (unique object classes)
+    into the folder for the XML files 0000.xml up to file_count - 1.
+    Returns the set of unique classes found.
+    """
+    # Output files
+    output_file = os.path.join(xml_folder, "output.txt")  # Stores file names and object classes
+    classes_file = os.path.join(xml_folder, "classes.txt")  # Stores unique object classes found
+
+    # Initialize a set to store unique classes
+    unique_classes = set()
+
+    # Open output file for writing
+    with open(output_file, "w") as out_f:
+        for i in range(file_count):
+            xml_filename = f"{i:04d}.xml"  # Generates filenames like 0000.xml, 0001.xml, etc.
+            xml_path = os.path.join(xml_folder, xml_filename)
+
+            # Check if the file exists
+            if not os.path.exists(xml_path):
+                print(f"Skipping {xml_filename}, file not found.")
+                continue
+
+            try:
+                # Parse XML
+                tree = ET.parse(xml_path)
+                root = tree.getroot()
+
+                # Extract object classes
+                object_classes = set()
+                for obj in root.findall("object"):
+                    name_tag = obj.find("name")
+                    if name_tag is not None:
+                        class_name = name_tag.text.strip()
+                        object_classes.add(class_name)
+                        unique_classes.add(class_name)  # Add to global class set
+
+                # Write to output file if objects exist
+                if object_classes:
+                    out_f.write(f"{xml_filename} | {', '.join(sorted(object_classes))}\n")
+
+            except ET.ParseError:
+                print(f"Error parsing {xml_filename}, skipping.")
+
+    # Save unique classes to a separate file
+    with open(classes_file, "w") as class_f:
+        for class_name in sorted(unique_classes):
+            class_f.write(f"{class_name}\n")
+
+    return unique_classes
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="List the object classes in every XML file of the combined folder.")
+    parser.add_argument("xml_folder", help="Folder containing 0000.jpg, 0000.xml, 0001.jpg etc.")
+    parser.add_argument("--file-count", type=int, default=DEFAULT_FILE_COUNT, help="Number of sequentially named XML files.")
+    args = parser.parse_args(argv)
+
+    # Ensure the folder exists
+    if not os.path.exists(args.xml_folder):
+        print(f"Error: The folder '{args.xml_folder}' does not exist!")
+        return 1
+
+    overview(args.xml_folder, args.file_count)
+
+    output_file = os.path.join(args.xml_folder, "output.txt")
+    classes_file = os.path.join(args.xml_folder, "classes.txt")
+    print(f"Processing complete! Check '{output_file}' and '{classes_file}'.")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
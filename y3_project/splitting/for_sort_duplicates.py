@@ -0,0 +1,124 @@
+import os
+import sys
+import random
+import argparse
+
+def sort_duplicates(xml_folder, seed=None):
+    """
+    Keep each XML file only in the largest of the classes it appears in, then shuffle every
+    <class>.txt and split it 60:20:20 into <class>_Train.txt, <class>_Validate.txt and <class>_Test.txt.
+    Requires classes.txt and the class files written by for_classes.
+    Returns a list of (train_path, validate_path, test_path) for every class split.
+    """
+    # Path to the classes.txt file
+    classes_file = os.path.join(xml_folder, "classes.txt")
+
+    # Read all class names from classes.txt
+    with open(classes_file, "r", encoding="utf-8") as f:
+        class_names = [line.strip() for line in f if line.strip()]
+
+    # Dictionary to store class file mappings
+    class_files = {class_name: os.path.join(xml_folder, f"{class_name}.txt") for class_name in class_names}
+
+    # Read all class text files and count occurrences
+    file_counts = {}  # Tracks how many times each XML file appears
+
+    for class_name, class_file in class_files.items():
+        if not os.path.exists(class_file):
+            continue
+        with open(class_file, "r", encoding="utf-8") as f:
+            for line in f:
+                xml_file = line.strip()
+                if xml_file:
+                    file_counts.setdefault(xml_file, []).append(class_name)
+
+    # Remove duplicates (keep XML file only in the largest class)
+    for xml_file, classes in file_counts.items():
+        if len(classes) > 1:
+            # Find the class with the most XML files
+            largest_class = max(classes, key=lambda cls: _count_lines(class_files[cls]))
+            # Remove XML file from all other classes
+            for cls in classes:
+                if cls != largest_class:
+                    class_file_path = class_files[cls]
+                    with open(class_file_path, "r", encoding="utf-8") as f:
+                        lines = f.readlines()
+                    with open(class_file_path, "w", encoding="utf-8") as f:
+                        for line in lines:
+                            if line.strip() != xml_file:
+                                f.write(line)
+
+    # Own random generator so repeated calls in one process do not share state
+    rng = random.Random(seed)
+
+    # Read updated files, shuffle, and split
+    created = []
+    for class_name, class_file in class_files.items():
+        if not os.path.exists(class_file):
+            continue
+
+        # Read the remaining XML files
+        with open(class_file, "r", encoding="utf-8") as f:
+            xml_files = [line.strip() for line in f if line.strip()]
+
+        if not xml_files:
+            continue  # Skip empty classes
+
+        # Shuffle the order
+        rng.shuffle(xml_files)
+
+        # Calculate split sizes
+        total = len(xml_files)
+        train_size = int(total * 0.6)
+        validate_size = int(total * 0.2)
+
+        # Split files (the remaining 20% is the test split)
+        train_files = xml_files[:train_size]
+        validate_files = xml_files[train_size:train_size + validate_size]
+        test_files = xml_files[train_size + validate_size:]
+
+        # Save new split files
+        train_path = os.path.join(xml_folder, f"{class_name}_Train.txt")
+        validate_path = os.path.join(xml_folder, f"{class_name}_Validate.txt")
+        test_path = os.path.join(xml_folder, f"{class_name}_Test.txt")
+
+        with open(train_path, "w", encoding="utf-8") as f:
+            f.write("\n".join(train_files) + "\n")
+
+        with open(validate_path, "w", encoding="utf-8") as f:
+            f.write("\n".join(validate_files) + "\n")
+
+        with open(test_path, "w", encoding="utf-8") as f:
+            f.write("\n".join(test_files) + "\n")
+
+        print(f"Created: {train_path}, {validate_path}, {test_path}")
+        created.append((train_path, validate_path, test_path))
+
+    return created
+
+def _count_lines(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return sum(1 for _ in f)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Keep duplicate images in their biggest class only and split every class 60:20:20.")
+    parser.add_argument("xml_folder", help="Folder containing the XML files, classes.txt and the class files.")
+    parser.add_argument("--seed", type=int, default=None, help="Random seed for a reproducible split.")
+    args = parser.parse_args(argv)
+
+    # Ensure the folder exists
+    if not os.path.exists(args.xml_folder):
+        print(f"Error: The folder '{args.xml_folder}' does not exist!")
+        return 1
+
+    if not os.path.exists(os.path.join(args.xml_folder, "classes.txt")):
+        print("Error: classes.txt not found!")
+        return 1
+
+    sort_duplicates(args.xml_folder, args.seed)
+
+    print("Processing complete! All splits are saved.")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,113 @@
+import os
+import sys
+import shutil
+import asyncio
+import argparse
+from .async_file_ops import DEFAULT_CONCURRENCY, list_folder, positive_int, run_file_ops, run_file_ops_async
+
+def _plan_big_folder_moves(xml_folder):
+    # Returns the (shutil.move, source, destination) operations for move_into_big_folders
+    # and the class split folders they come from.
+    # Create the paths for the combined Train, Validate, and Test folders.
+    train_dir = os.path.join(xml_folder, "Train")
+    validate_dir = os.path.join(xml_folder, "Validate")
+    test_dir = os.path.join(xml_folder, "Test")
+
+    # Create the combined folders they should already been exist
+    os.makedirs(train_dir, exist_ok=True)
+    os.makedirs(validate_dir, exist_ok=True)
+    os.makedirs(test_dir, exist_ok=True)
+
+    # Files already in each big folder, listed once and updated as moves are queued
+    dest_files = {folder: list_folder(folder)[0] for folder in (train_dir, validate_dir, test_dir)}
+
+    # Moves to run, as (function, source, destination)
+    move_ops = []
+    split_folders = []
+
+    # Loop through every folder in the base directory
+    _, subfolders = list_folder(xml_folder)
+    for folder_name in sorted(subfolders):
+        folder_path = os.path.join(xml_folder, folder_name)
+
+        # Check the suffix of the folder name to determine which big folder to move into
+        if folder_name.endswith("_Train"):
+            target_dir = train_dir
+        elif folder_name.endswith("_Validate"):
+            target_dir = validate_dir
+        elif folder_name.endswith("_Test"):
+            target_dir = test_dir
+        else:
+            # If it doesnt match any known pattern, skip
+            continue
+        split_folders.append(folder_path)
+
+        # Queue all files from the subfolder for the chosen target folder
+        existing = dest_files[target_dir]
+        for file_name in sorted(list_folder(folder_path)[0]):
+            src_path = os.path.join(folder_path, file_name)
+            dest_path = os.path.join(target_dir, file_name)
+
+            # If the destination file already exists, skip to avoid overwriting
+            if file_name in existing:
+                print(f"Skipping duplicate: {dest_path}")
+                continue
+
+            # Cut and paste the file
+            existing.add(file_name)
+            move_ops.append((shutil.move, src_path, dest_path))
+
+    return move_ops, split_folders
+
+def _remove_empty_folders(folders):
+    # Delete the now-empty subfolders (folders still holding skipped duplicates are kept)
+    for folder_path in folders:
+        if not os.listdir(folder_path):
+            os.rmdir(folder_path)
+
+def move_into_big_folders(xml_folder, concurrency=DEFAULT_CONCURRENCY, remove_empty=False):
+    """
+    Move the files of every <class>_Train/_Validate/_Test folder into the combined Train,
+    Validate and Test folders, skipping files that already exist there.
+    If remove_empty is set, the class split folders are deleted once they are empty.
+    Returns a tuple of (number of files moved, number of moves that failed).
+    """
+    move_ops, split_folders = _plan_big_folder_moves(xml_folder)
+
+    # Move everything with bounded concurrency
+    result = run_file_ops(move_ops, concurrency, label="Moved")
+    if remove_empty:
+        _remove_empty_folders(split_folders)
+    return result
+
+async def move_into_big_folders_async(xml_folder, concurrency=DEFAULT_CONCURRENCY, remove_empty=False):
+    """
+    Awaitable version of move_into_big_folders, for callers that already run an event loop.
+    """
+    move_ops, split_folders = await asyncio.to_thread(_plan_big_folder_moves, xml_folder)
+    result = await run_file_ops_async(move_ops, concurrency, label="Moved")
+    if remove_empty:
+        await asyncio.to_thread(_remove_empty_folders, split_folders)
+    return result
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Move every class split folder into the big Train, Validate and Test folders.")
+    parser.add_argument("xml_folder", help="Folder containing the <class>_Train/_Validate/_Test folders.")
+    parser.add_argument("--concurrency", type=positive_int, default=DEFAULT_CONCURRENCY, help="Maximum number of moves in flight at once.")
+    parser.add_argument("--remove-empty", action="store_true", help="Delete the class split folders once they are empty.")
+    args = parser.parse_args(argv)
+
+    # Ensure the folder exists
+    if not os.path.exists(args.xml_folder):
+        print(f"Error: The folder '{args.xml_folder}' does not exist!")
+        return 1
+
+    move_into_big_folders(args.xml_folder, args.concurrency, args.remove_empty)
+
+    print("\nAll files have been moved to:")
+    for split in ("Train", "Validate", "Test"):
+        print(f"  {os.path.join(args.xml_folder, split)}")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())